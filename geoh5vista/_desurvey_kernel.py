@@ -0,0 +1,266 @@
+"""Numba-compiled kernel for desurveying drill hole depths in batch.
+
+The kernel consumes flat, contiguous float64 buffers describing the survey
+measurements of every hole (ragged arrays packed with start/stop offsets) and
+writes the desurveyed xyz locations into a preallocated output array. Holes
+are independent, so the outer loops are ``prange`` and numba distributes them
+across cores; callers get hole-level parallelism without managing a thread
+pool. When numba is not installed, vectorized NumPy implementations with the
+same contract are exported instead, so numba-less installs never fall back to
+interpreted per-element loops.
+"""
+
+__all__ = [
+    "HAVE_NUMBA",
+    "desurvey_all",
+    "interleave_rows",
+]
+
+__displayname__ = "Desurvey Kernel"
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; vectorized fallbacks are used below
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def interleave_rows(from_rows, to_rows, out):
+        """Interleave two (n, 3) row blocks into a preallocated (2n, 3) buffer.
+
+        Used to assemble segment endpoints for line meshes; each thread writes
+        disjoint output rows so the copy parallelizes without contention.
+        """
+        n = from_rows.shape[0]
+        for i in prange(n):
+            for k in range(3):
+                out[2 * i, k] = from_rows[i, k]
+                out[2 * i + 1, k] = to_rows[i, k]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def desurvey_all(
+        survey_start,
+        survey_stop,
+        survey_depths,
+        survey_az,
+        survey_dip,
+        collars,
+        depth_start,
+        depth_stop,
+        depths,
+        out_xyz,
+    ):
+        """Desurvey depths for all holes in one pass.
+
+        For each hole, station tangent vectors are computed from the
+        azimuth/dip measurements, station positions are integrated down from
+        the collar with the balanced tangential method, and each query depth
+        is located within its bracketing stations and interpolated along the
+        path. Depths above the first station or below the last one are
+        extrapolated along the nearest station's tangent.
+
+        Args:
+            survey_start (ndarray): Per-hole start offsets into the flat survey buffers
+            survey_stop (ndarray): Per-hole stop offsets into the flat survey buffers
+            survey_depths (ndarray): Flat survey station depths for all holes
+            survey_az (ndarray): Flat survey azimuths, in degrees, for all holes
+            survey_dip (ndarray): Flat survey dips, in degrees, for all holes
+            collars (ndarray): Per-hole collar coordinates, shape (n_holes, 3)
+            depth_start (ndarray): Per-hole start offsets into ``depths``
+            depth_stop (ndarray): Per-hole stop offsets into ``depths``
+            depths (ndarray): Flat query depths for all holes, grouped by hole
+            out_xyz (ndarray): Preallocated output, shape (len(depths), 3)
+        """
+        n_holes = survey_start.shape[0]
+        deg2rad = math.pi / 180.0
+
+        for h in prange(n_holes):
+            s0 = survey_start[h]
+            s1 = survey_stop[h]
+            n_stations = s1 - s0
+
+            # unit tangent vector (east, north, up) at each station
+            tangents = np.empty((n_stations, 3))
+            for j in range(n_stations):
+                az = survey_az[s0 + j] * deg2rad
+                dip = survey_dip[s0 + j] * deg2rad
+                cos_dip = math.cos(dip)
+                tangents[j, 0] = cos_dip * math.sin(az)
+                tangents[j, 1] = cos_dip * math.cos(az)
+                tangents[j, 2] = math.sin(dip)
+
+            # integrate station positions down from the collar
+            positions = np.empty((n_stations, 3))
+            for k in range(3):
+                positions[0, k] = collars[h, k] + tangents[0, k] * survey_depths[s0]
+            for j in range(1, n_stations):
+                delta = survey_depths[s0 + j] - survey_depths[s0 + j - 1]
+                for k in range(3):
+                    positions[j, k] = positions[j - 1, k] + 0.5 * (
+                        tangents[j - 1, k] + tangents[j, k]
+                    ) * delta
+
+            for i in range(depth_start[h], depth_stop[h]):
+                depth = depths[i]
+
+                if depth <= survey_depths[s0]:
+                    # above the first station: extrapolate along its tangent
+                    delta = depth - survey_depths[s0]
+                    for k in range(3):
+                        out_xyz[i, k] = positions[0, k] + tangents[0, k] * delta
+                    continue
+
+                if depth >= survey_depths[s1 - 1]:
+                    # below the last station: extrapolate along its tangent
+                    delta = depth - survey_depths[s1 - 1]
+                    for k in range(3):
+                        out_xyz[i, k] = (
+                            positions[n_stations - 1, k]
+                            + tangents[n_stations - 1, k] * delta
+                        )
+                    continue
+
+                # binary search for the bracketing stations
+                lo = 0
+                hi = n_stations - 1
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if survey_depths[s0 + mid] <= depth:
+                        lo = mid
+                    else:
+                        hi = mid
+
+                seg_length = survey_depths[s0 + hi] - survey_depths[s0 + lo]
+                if seg_length > 0:
+                    frac = (depth - survey_depths[s0 + lo]) / seg_length
+                else:
+                    frac = 0.0
+                delta = depth - survey_depths[s0 + lo]
+                for k in range(3):
+                    # tangent linearly interpolated to the query depth,
+                    # averaged with the upper station's tangent (balanced
+                    # tangential)
+                    tangent_at_depth = tangents[lo, k] + frac * (
+                        tangents[hi, k] - tangents[lo, k]
+                    )
+                    out_xyz[i, k] = (
+                        positions[lo, k]
+                        + 0.5 * (tangents[lo, k] + tangent_at_depth) * delta
+                    )
+
+else:
+
+    def interleave_rows(from_rows, to_rows, out):
+        """Interleave two (n, 3) row blocks into a preallocated (2n, 3) buffer.
+
+        NumPy fallback: two strided assignments, one memcpy-like pass each.
+        """
+        out[0::2] = from_rows
+        out[1::2] = to_rows
+
+    def desurvey_all(
+        survey_start,
+        survey_stop,
+        survey_depths,
+        survey_az,
+        survey_dip,
+        collars,
+        depth_start,
+        depth_stop,
+        depths,
+        out_xyz,
+    ):
+        """Desurvey depths for all holes in one pass.
+
+        Vectorized NumPy fallback with the same contract and math as the
+        compiled kernel: station tangents are computed for all holes at once,
+        and each hole's positions and query depths are handled with array
+        operations instead of per-depth loops. Like the compiled kernel, the
+        per-hole offsets may address any subset of the flat survey buffers in
+        any order.
+        """
+        az = np.radians(survey_az)
+        dip = np.radians(survey_dip)
+        cos_dip = np.cos(dip)
+        tangents = np.empty((survey_depths.shape[0], 3))
+        tangents[:, 0] = cos_dip * np.sin(az)
+        tangents[:, 1] = cos_dip * np.cos(az)
+        tangents[:, 2] = np.sin(dip)
+
+        for h in range(survey_start.shape[0]):
+            s0 = survey_start[h]
+            s1 = survey_stop[h]
+            q = depths[depth_start[h] : depth_stop[h]]
+            out = out_xyz[depth_start[h] : depth_stop[h]]
+            station_depths = survey_depths[s0:s1]
+            hole_tangents = tangents[s0:s1]
+
+            # integrate this hole's station positions down from its collar;
+            # the offsets may address any subset of the flat buffers in any
+            # order, so nothing is accumulated across holes
+            hole_positions = np.empty_like(hole_tangents)
+            hole_positions[0] = collars[h] + hole_tangents[0] * station_depths[0]
+            if station_depths.shape[0] > 1:
+                contrib = (
+                    0.5
+                    * (hole_tangents[1:] + hole_tangents[:-1])
+                    * np.diff(station_depths)[:, None]
+                )
+                hole_positions[1:] = hole_positions[0] + np.cumsum(contrib, axis=0)
+
+            if station_depths.shape[0] == 1:
+                out[:] = hole_positions[0] + hole_tangents[0] * (
+                    q - station_depths[0]
+                )[:, None]
+                continue
+
+            lo = np.clip(
+                np.searchsorted(station_depths, q, side="right") - 1,
+                0,
+                station_depths.shape[0] - 2,
+            )
+            hi = lo + 1
+            seg_length = station_depths[hi] - station_depths[lo]
+            delta = q - station_depths[lo]
+            frac = np.divide(
+                delta, seg_length, out=np.zeros_like(q), where=seg_length > 0
+            )
+            tangent_lo = hole_tangents[lo]
+            tangent_at_depth = tangent_lo + frac[:, None] * (
+                hole_tangents[hi] - tangent_lo
+            )
+            out[:] = (
+                hole_positions[lo]
+                + 0.5 * (tangent_lo + tangent_at_depth) * delta[:, None]
+            )
+
+            # extrapolate above the first station and below the last one
+            above = q <= station_depths[0]
+            if above.any():
+                out[above] = hole_positions[0] + hole_tangents[0] * (
+                    q[above] - station_depths[0]
+                )[:, None]
+            below = q >= station_depths[-1]
+            if below.any():
+                out[below] = hole_positions[-1] + hole_tangents[-1] * (
+                    q[below] - station_depths[-1]
+                )[:, None]
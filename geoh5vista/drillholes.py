@@ -10,9 +10,47 @@ __displayname__ = "Line Set"
 import numpy as np
 import pyvista
 
+from geoh5vista._desurvey_kernel import HAVE_NUMBA, njit
 from geoh5vista.utilities import add_data
 
 
+@njit
+def _segment_regions(n_points, segments):
+    """Label connected line segments with region indices.
+
+    Union-find over the segment endpoints, numbering regions in order of
+    first appearance to match the RegionId output of the VTK connectivity
+    filter without running a BFS over the whole cell graph.
+    """
+    parent = np.arange(n_points)
+    for e in range(segments.shape[0]):
+        a = segments[e, 0]
+        b = segments[e, 1]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[b] = a
+
+    labels = np.full(n_points, -1, dtype=np.int64)
+    regions = np.empty(segments.shape[0], dtype=np.int64)
+    n_regions = 0
+    for e in range(segments.shape[0]):
+        a = segments[e, 0]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        if labels[a] < 0:
+            labels[a] = n_regions
+            n_regions += 1
+        regions[e] = labels[a]
+
+    return regions
+
+
 def line_set_to_vtk(lse, origin=(0.0, 0.0, 0.0)):
     """Convert the line set to a :class:`pyvista.PolyData` data object.
 
@@ -23,21 +61,34 @@ def line_set_to_vtk(lse, origin=(0.0, 0.0, 0.0)):
         :class:`pyvista.PolyData`
     """
     ids = np.array(lse.geometry.segments).reshape(-1, 2).astype(np.int_)
-    lines = np.c_[np.full(len(ids), 2, dtype=np.int_), ids]
+    # fill the final connectivity array directly rather than stacking a
+    # column of 2's onto ids, which allocates two intermediates
+    lines = np.empty((ids.shape[0], 3), dtype=np.int_)
+    lines[:, 0] = 2
+    lines[:, 1:] = ids
+
+    # translate into a fresh buffer: assigning the input vertices directly
+    # can be zero-copy, and shifting them in place afterwards would corrupt
+    # the caller's geometry on every call
+    vertices = np.ascontiguousarray(lse.geometry.vertices, dtype=np.float64)
+    points = vertices + np.asarray(origin, dtype=np.float64)
 
     output = pyvista.PolyData()
-    output.points = np.array(lse.geometry.vertices)
+    output.points = points
     output.lines = lines
 
-    indices = output.connectivity().cell_data["RegionId"]
-    output["Line Index"] = indices
+    if HAVE_NUMBA:
+        output["Line Index"] = _segment_regions(output.n_points, ids)
+    else:
+        # without numba the union-find would run interpreted; VTK's compiled
+        # connectivity filter is far faster there
+        output["Line Index"] = output.connectivity().cell_data["RegionId"]
 
     # Now add data to lines:
     add_data(output, lse.data)
 
     # TODO: if subtype is borehole make a tube
 
-    output.points += np.array(origin)
     return output
 
 
@@ -54,6 +105,12 @@ import pandas as pd
 import distinctipy
 from matplotlib.colors import ListedColormap
 
+try:
+    from vtkmodules.util.numpy_support import numpy_to_vtk
+except ImportError:
+    from vtk.util.numpy_support import numpy_to_vtk
+
+from ._desurvey_kernel import desurvey_all, interleave_rows
 from .plotter import Plotter
 from .drill_log import DrillLog
 from .utils import (
@@ -65,6 +122,23 @@ from .utils import (
 )
 
 
+def _categorical_code_dtype(n_categories):
+    """Return the smallest integer dtype that holds the given number of
+    category codes. Narrow codes cut memory bandwidth in the render path."""
+    if n_categories <= np.iinfo(np.uint8).max + 1:
+        return np.uint8
+    if n_categories <= np.iinfo(np.uint16).max + 1:
+        return np.uint16
+    return np.int32
+
+
+def _extend_unique(names, new_names):
+    """Extend a name list in place, skipping entries already present, so
+    repeated add/make calls cannot grow the list with duplicates."""
+    seen = set(names)
+    names.extend(name for name in new_names if name not in seen)
+
+
 class HoleData:
     """Base class for storing and desurveying drill hole data. Used by `DrillDown.Points` and `DrillDown.Intervals`."""
 
@@ -74,11 +148,22 @@ class HoleData:
         self.categorical_array_names = []
         self.continuous_array_names = []
         self._depths = None
+        self._sort_order = None
+        self._hole_indices = {}
+        self._hole_ids_encoded = None
+        self._starts = None
         self.data = {}
+        self._cont = None
+        self._cat = None
+        self._cont_cols = {}
+        self._cat_cols = {}
         self.image_array_names = []
         self.cat_to_color_map = {}
         self.code_to_cat_map = {}
         self.cat_to_code_map = {}
+        self._code_to_cat_luts = {}
+        self._cat_sorters = {}
+        self._cmap_cache = {}
         self.matplotlib_formatted_color_maps = {}
         self.categorical_color_rng = 999
         self.categorical_pastel_factor = 0.2
@@ -162,50 +247,140 @@ class HoleData:
         # add from-to depths
         depths = convert_to_numpy_array(depths)
 
-        ## remove data corresponding to NaN depths
-        if depths.ndim > 1:
-            nan_bool = np.any(np.isnan(depths), axis=1)
-        else:
-            nan_bool = np.isnan(depths)
-
-        if np.any(nan_bool):
+        ## remove data corresponding to NaN depths. NaN propagates through
+        ## min(), so a scalar reduction detects the common all-finite case
+        ## without materializing a boolean mask; `x != x` flags NaNs in one
+        ## pass when filtering is actually needed
+        if depths.size > 0 and np.isnan(np.min(depths)):
+            nan_bool = depths != depths
+            if nan_bool.ndim > 1:
+                nan_bool = nan_bool.any(axis=1)
             depths = depths[~nan_bool]
             self.hole_ids = self.hole_ids[~nan_bool]
+            hole_ids_encoded = hole_ids_encoded[~nan_bool]
             data = data[~nan_bool]
 
-        self.depths = depths
+        # keep the per-row hole ID codes so make_mesh can assign them with a
+        # single gather, and sort all rows by hole once so every per-hole
+        # access downstream is a contiguous slice instead of a boolean scan
+        self._hole_ids_encoded = hole_ids_encoded.astype(
+            _categorical_code_dtype(hole_ids_unique.shape[0]), copy=False
+        )
+        self._sort_order = np.argsort(self._hole_ids_encoded, kind="stable")
+        self.hole_ids = self.hole_ids[self._sort_order]
+        self._hole_ids_encoded = self._hole_ids_encoded[self._sort_order]
+        self.depths = depths[self._sort_order]
+
+        counts = np.bincount(
+            self._hole_ids_encoded, minlength=hole_ids_unique.shape[0]
+        )
+        self._starts = np.concatenate([[0], np.cumsum(counts)])
+        self._hole_indices = {
+            id: slice(self._starts[code], self._starts[code + 1])
+            for code, id in enumerate(hole_ids_unique)
+        }
+        self._grouped_hole_ids = hole_ids_unique
+        self._hole_counts = counts
 
         # add data
         if isinstance(data, pd.core.frame.DataFrame):
             array_names = data.columns.tolist()
-            self.array_names_all += array_names
-            data = data.values
+            _extend_unique(self.array_names_all, array_names)
+
+            # batch-convert by dtype: the numeric block is cast to float64 in
+            # one shot and only the remaining object columns are encoded
+            # individually, instead of type-dispatching per column
+            num_df = data.select_dtypes(include="number")
+            cat_df = data.select_dtypes(exclude="number")
+
+            if num_df.shape[1] > 0:
+                # Fortran order keeps each column contiguous for zero-copy
+                # hand-off to VTK
+                self._cont = np.asfortranarray(
+                    num_df.to_numpy(dtype=np.float64)[self._sort_order]
+                )
+                for col, array_name in enumerate(num_df.columns):
+                    self.continuous_array_names.append(array_name)
+                    self._cont_cols[array_name] = col
+                    self.data[array_name] = {
+                        "values": self._cont[:, col],
+                        "type": "float",
+                    }
+
+            cat_datasets = []
+            for array_name in cat_df.columns:
+                self.categorical_array_names.append(array_name)
+
+                codes, categories = pd.factorize(cat_df[array_name].astype(str))
+                codes = codes.astype(
+                    _categorical_code_dtype(categories.shape[0]), copy=False
+                )[self._sort_order]
+                self.code_to_cat_map[array_name] = dict(enumerate(categories))
+                self.cat_to_code_map[array_name] = {
+                    cat: code for code, cat in enumerate(categories)
+                }
+
+                self._cat_cols[array_name] = len(cat_datasets)
+                cat_datasets.append(codes)
+                self.data[array_name] = {
+                    "values": codes,
+                    "type": "str",
+                }
 
         else:
             if len(array_names) == 0:
                 raise ValueError("Array names must be provided.")
 
-        data = convert_to_numpy_array(data, collapse_dim=False)
-        for dataset, array_name in zip(data.T, array_names):
-            dataset, _type = convert_array_type(dataset, return_type=True)
+            data = convert_to_numpy_array(data, collapse_dim=False)
+            data = data[self._sort_order]
+            cont_datasets = []
+            cat_datasets = []
+            for dataset, array_name in zip(data.T, array_names):
+                dataset, _type = convert_array_type(dataset, return_type=True)
+
+                if _type == "str":  # categorical data
+                    self.categorical_array_names.append(array_name)
+
+                    # encode categorical data
+                    code_to_cat_map, dataset = encode_categorical_data(dataset)
+                    dataset = dataset.astype(
+                        _categorical_code_dtype(len(code_to_cat_map)), copy=False
+                    )
+                    self.code_to_cat_map[array_name] = code_to_cat_map
+                    self.cat_to_code_map[array_name] = {
+                        cat: code for code, cat in code_to_cat_map.items()
+                    }
+
+                    self._cat_cols[array_name] = len(cat_datasets)
+                    cat_datasets.append(dataset)
 
-            if _type == "str":  # categorical data
-                self.categorical_array_names.append(array_name)
+                else:
+                    self.continuous_array_names.append(array_name)
 
-                # encode categorical data
-                code_to_cat_map, dataset = encode_categorical_data(dataset)
-                self.code_to_cat_map[array_name] = code_to_cat_map
-                self.cat_to_code_map[array_name] = {
-                    cat: code for code, cat in code_to_cat_map.items()
+                    self._cont_cols[array_name] = len(cont_datasets)
+                    cont_datasets.append(dataset)
+
+                self.data[array_name] = {
+                    "values": dataset,
+                    "type": _type,
                 }
 
-            else:
-                self.continuous_array_names.append(array_name)
+            # pack the columns into a dense structure-of-arrays matrix; the
+            # per-name entries in self.data are rebound to column views below.
+            # Fortran order keeps each column contiguous for zero-copy
+            # hand-off to VTK
+            if len(cont_datasets) > 0:
+                self._cont = np.asfortranarray(
+                    np.column_stack(cont_datasets).astype(np.float64)
+                )
+                for array_name, col in self._cont_cols.items():
+                    self.data[array_name]["values"] = self._cont[:, col]
 
-            self.data[array_name] = {
-                "values": dataset,
-                "type": _type,
-            }
+        if len(cat_datasets) > 0:
+            # column_stack promotes to the widest of the quantized code dtypes
+            self._cat = np.asfortranarray(np.column_stack(cat_datasets))
+            for array_name, col in self._cat_cols.items():
+                self.data[array_name]["values"] = self._cat[:, col]
 
         self.image_array_names = image_array_names
 
@@ -242,9 +417,23 @@ class HoleData:
 
         for array_name in array_names:
             categories = self.cat_to_code_map[array_name].keys()
-            cat_to_color_map, matplotlib_formatted_color_maps = make_categorical_cmap(
-                categories, cycle=cycle, rng=rng, pastel_factor=pastel_factor
-            )
+
+            # skip the color optimization when the categories and settings
+            # are unchanged since the last construction for this array
+            key = (tuple(categories), cycle, rng, pastel_factor)
+            cached = self._cmap_cache.get(array_name)
+            if cached is not None and cached[0] == key:
+                cat_to_color_map, matplotlib_formatted_color_maps = cached[1]
+            else:
+                cat_to_color_map, matplotlib_formatted_color_maps = (
+                    make_categorical_cmap(
+                        categories, cycle=cycle, rng=rng, pastel_factor=pastel_factor
+                    )
+                )
+                self._cmap_cache[array_name] = (
+                    key,
+                    (cat_to_color_map, matplotlib_formatted_color_maps),
+                )
 
             self.cat_to_color_map[array_name] = cat_to_color_map
             self.matplotlib_formatted_color_maps[array_name] = (
@@ -293,6 +482,20 @@ class HoleData:
             if not isinstance(cmap, dict):
                 raise TypeError("Categorical color map must be a dictionary.")
 
+            # reuse the previous maps when neither the categories nor the
+            # requested colors changed; distinctipy color selection is costly
+            key = (
+                tuple(self.cat_to_code_map[array_name].keys()),
+                tuple((cat, tuple(np.ravel(color))) for cat, color in cmap.items()),
+            )
+            cached = self._cmap_cache.get(array_name)
+            if cached is not None and cached[0] == key:
+                (
+                    self.cat_to_color_map[array_name],
+                    self.matplotlib_formatted_color_maps[array_name],
+                ) = cached[1]
+                return
+
             # ensure categorical color map colors are fractional
             cmap = make_color_map_fractional(cmap)
 
@@ -319,7 +522,7 @@ class HoleData:
             }
 
             # create encoded categorical color map
-            codes = [self.cat_to_code_map[array_name][cat] for cat in categories]
+            codes = self._cat_to_codes(array_name, categories)
 
             # create matplotlib categorical color map
             codes.sort()
@@ -332,6 +535,14 @@ class HoleData:
                 ]
             )
 
+            self._cmap_cache[array_name] = (
+                key,
+                (
+                    self.cat_to_color_map[array_name],
+                    self.matplotlib_formatted_color_maps[array_name],
+                ),
+            )
+
     @property
     def depths(self):
         """Return depths along the drill hole paths.
@@ -355,6 +566,77 @@ class HoleData:
             depths = convert_to_numpy_array(depths)
         self._depths = depths.astype(np.float64)
 
+    def _code_to_cat_lut(self, array_name):
+        """Return a cached code-to-category lookup array for a given array name.
+
+        Decoding encoded categorical values then becomes a single fancy-index
+        instead of a Python loop over the code-to-category dictionary.
+        """
+        lut = self._code_to_cat_luts.get(array_name)
+        if lut is None:
+            code_to_cat_map = self.code_to_cat_map[array_name]
+            lut = np.array(
+                [code_to_cat_map[code] for code in range(len(code_to_cat_map))],
+                dtype=object,
+            )
+            self._code_to_cat_luts[array_name] = lut
+
+        return lut
+
+    def _cat_to_codes(self, array_name, cats):
+        """Return the codes for the given categories of a given array name.
+
+        The inverse of `self._code_to_cat_lut`, resolved with a vectorized
+        searchsorted over a cached sort of the category array instead of
+        per-item dictionary access.
+        """
+        cat_arr = self._code_to_cat_lut(array_name)
+        sorter = self._cat_sorters.get(array_name)
+        if sorter is None:
+            sorter = np.argsort(cat_arr)
+            self._cat_sorters[array_name] = sorter
+
+        cats = np.asarray(cats, dtype=object)
+        positions = np.searchsorted(cat_arr, cats, sorter=sorter)
+        codes = sorter[np.minimum(positions, cat_arr.shape[0] - 1)]
+        missing = cat_arr[codes] != cats
+        if np.any(missing):
+            raise KeyError(cats[missing][0])
+
+        return codes
+
+    def _desurvey_depths(self, surveys, depths):
+        """Desurvey a flat depth array for every hole with a single call to
+        the batched desurvey kernel.
+
+        Rows are stored grouped by hole since `self.add_data`, so the per-hole
+        depth groups are the contiguous `self._starts` slices and no gather or
+        scatter is needed around the kernel call.
+        """
+        tables = surveys.desurvey_tables
+
+        rows = np.array(
+            [tables["hole_rows"][id] for id in self._grouped_hole_ids],
+            dtype=np.int64,
+        )
+
+        depths = np.ascontiguousarray(depths, dtype=np.float64)
+        out = np.empty((depths.shape[0], 3))
+        desurvey_all(
+            tables["survey_start"][rows],
+            tables["survey_stop"][rows],
+            tables["survey_depths"],
+            tables["survey_az"],
+            tables["survey_dip"],
+            tables["collars"][rows],
+            self._starts[:-1],
+            self._starts[1:],
+            depths,
+            out,
+        )
+
+        return out
+
 
 class Points(HoleData):
     """Class for storing and desurveying drill hole point data (i.e., data at specific depths along a drill hole). Inherits from `HoleData`."""
@@ -421,61 +703,57 @@ class Points(HoleData):
         self.surveys = surveys
         self.collars = surveys.collars
 
-        self.depths_desurveyed = np.empty((self.depths.shape[0], 3))
-
-        for id in self.unique_hole_ids:
-            hole_filter = self.hole_ids == id
-            hole = self.surveys._holes[id]
-            depths = self.depths[hole_filter]
-            depths_desurveyed = hole.desurvey(depths)
-            self.depths_desurveyed[hole_filter] = depths_desurveyed
+        self.depths_desurveyed = self._desurvey_depths(surveys, self.depths)
 
     def make_mesh(self):
         """Make a mesh of the desurveyed drill hole points data.
 
+        All holes are assembled into a single :class:`pyvista.PolyData` in one
+        pass, rather than appending per-hole meshes, which copies every point
+        and data array once per hole.
+
         Returns
         -------
         pyvista.PolyData
             Mesh of the desurveyed drill hole points data.
         """
-        meshes = None
-
-        for id in self.unique_hole_ids:
-            hole_filter = self.hole_ids == id
-            depths = self.depths[hole_filter]
-
-            if self.depths.shape[0] > 0:
-                depths_desurveyed = self.depths_desurveyed[hole_filter]
-
-                mesh = pv.PolyData(depths_desurveyed)
-
-                for array_name in self.array_names_all:
-                    data = self.data[array_name]["values"][hole_filter]
-                    _type = self.data[array_name]["type"]
-                    if _type == "str":
-                        mesh[array_name] = data
-                    else:
-                        mesh.point_data[array_name] = data
-
-                mesh.point_data["depth"] = depths
-                mesh.point_data["hole ID"] = [
-                    self.cat_to_code_map["hole ID"][id]
-                ] * depths.shape[0]
-
-                mesh.point_data["x"] = depths_desurveyed[:, 0]
-                mesh.point_data["y"] = depths_desurveyed[:, 1]
-                mesh.point_data["z"] = depths_desurveyed[:, 2]
-
-                self.continuous_array_names += ["depth", "x", "y", "z"]
+        if self.depths.shape[0] == 0:
+            self.mesh = None
+            return None
+
+        # float32 at the VTK boundary halves the point-buffer bandwidth;
+        # desurvey math stays float64 upstream
+        mesh = pv.PolyData(
+            np.ascontiguousarray(self.depths_desurveyed, dtype=np.float32)
+        )
 
-                if meshes is None:
-                    meshes = mesh
-                else:
-                    meshes += mesh
+        for array_name in self.array_names_all:
+            data = self.data[array_name]["values"]
+            _type = self.data[array_name]["type"]
+            if _type == "str":
+                mesh[array_name] = data
+            else:
+                # shallow wrap: VTK references the contiguous column view
+                # instead of copying it; self keeps the buffer alive
+                vtk_arr = numpy_to_vtk(data, deep=False)
+                vtk_arr.SetName(array_name)
+                mesh.GetPointData().AddArray(vtk_arr)
+
+        mesh.point_data["depth"] = self.depths
+        mesh.point_data["hole ID"] = self._hole_ids_encoded
+
+        mesh.point_data["x"] = self.depths_desurveyed[:, 0]
+        mesh.point_data["y"] = self.depths_desurveyed[:, 1]
+        mesh.point_data["z"] = self.depths_desurveyed[:, 2]
+
+        # dedupe so repeated make_mesh calls do not grow the name list
+        self.continuous_array_names = list(
+            dict.fromkeys(self.continuous_array_names + ["depth", "x", "y", "z"])
+        )
 
-        self.mesh = meshes
+        self.mesh = mesh
 
-        return meshes
+        return mesh
 
     def show(self, show_collars=False, show_surveys=False, *args, **kwargs):
         """Plot the desurveyed drill hole points data.
@@ -529,7 +807,8 @@ class Points(HoleData):
 
         log = DrillLog()
 
-        depths = self.depths[self.hole_ids == hole_id]
+        hole_indices = self._hole_indices[hole_id]
+        depths = self.depths[hole_indices]
 
         if isinstance(log_array_names, str):
             log_array_names = [log_array_names]
@@ -538,14 +817,14 @@ class Points(HoleData):
 
         for array_name in log_array_names:
             if array_name in self.categorical_array_names:
-                values = self.data[array_name]["values"][self.hole_ids == hole_id]
+                values = self.data[array_name]["values"][hole_indices]
                 cat_to_color_map = self.cat_to_color_map.get(array_name, None)
                 log.add_categorical_point_data(
                     array_name, depths, values, cat_to_color_map
                 )
 
             elif array_name in self.continuous_array_names:
-                values = self.data[array_name]["values"][self.hole_ids == hole_id]
+                values = self.data[array_name]["values"][hole_indices]
 
                 log.add_continuous_point_data(array_name, depths, values)
 
@@ -642,26 +921,16 @@ class Intervals(HoleData):
         self.surveys = surveys
         self.collars = surveys.collars
 
-        self.from_depths_desurveyed = np.empty((self.depths.shape[0], 3))
-        self.to_depths_desurveyed = np.empty((self.depths.shape[0], 3))
-        self.intermediate_depths_desurveyed = np.empty((self.depths.shape[0], 3))
-
-        for id in self.unique_hole_ids:
-            hole_filter = self.hole_ids == id
-            from_to = self.depths[hole_filter]
-            hole = self.surveys._holes[id]
-
-            from_depths_desurveyed = hole.desurvey(from_to[:, 0])
-            to_depths_desurveyed = hole.desurvey(from_to[:, 1])
-            intermediate_depths_desurveyed = np.mean(
-                [from_depths_desurveyed, to_depths_desurveyed], axis=0
-            )
-
-            self.from_depths_desurveyed[hole_filter] = from_depths_desurveyed
-            self.to_depths_desurveyed[hole_filter] = to_depths_desurveyed
-            self.intermediate_depths_desurveyed[hole_filter] = (
-                intermediate_depths_desurveyed
-            )
+        self.from_depths_desurveyed = self._desurvey_depths(
+            surveys, self.depths[:, 0]
+        )
+        self.to_depths_desurveyed = self._desurvey_depths(surveys, self.depths[:, 1])
+        # plain average; np.mean over a stacked list would allocate and
+        # traverse an extra (2, N, 3) array
+        self.intermediate_depths_desurveyed = np.add(
+            self.from_depths_desurveyed, self.to_depths_desurveyed
+        )
+        self.intermediate_depths_desurveyed *= 0.5
 
     def make_mesh(self):
         """
@@ -673,51 +942,47 @@ class Intervals(HoleData):
             Mesh of the desurveyed drill hole interval data.
 
         """
-        meshes = None
-
-        for id in self.unique_hole_ids:
-            hole = self.surveys._holes[id]
-            hole_filter = self.hole_ids == id
-            from_to = self.depths[hole_filter]
-
-            if from_to.shape[0] > 0:
-                from_depths_desurveyed = self.from_depths_desurveyed[hole_filter]
-                to_depths_desurveyed = self.to_depths_desurveyed[hole_filter]
-                intermediate_depths_desurveyed = self.intermediate_depths_desurveyed[
-                    hole_filter
-                ]
-
-                mesh = hole._make_line_mesh(
-                    from_depths_desurveyed, to_depths_desurveyed
-                )
+        if self.depths.shape[0] == 0:
+            self.mesh = None
+            return None
+
+        # the line mesh for all holes is built in one pass; _make_line_mesh
+        # only interleaves its arguments, so any hole instance will do
+        hole = self.surveys._holes[self.unique_hole_ids[0]]
+        mesh = hole._make_line_mesh(
+            self.from_depths_desurveyed, self.to_depths_desurveyed
+        )
 
-                mesh.cell_data["from"] = from_to[:, 0]
-                mesh.cell_data["to"] = from_to[:, 1]
-                mesh.cell_data["hole ID"] = [
-                    self.cat_to_code_map["hole ID"][id]
-                ] * from_to.shape[0]
+        mesh.cell_data["from"] = self.depths[:, 0]
+        mesh.cell_data["to"] = self.depths[:, 1]
+        mesh.cell_data["hole ID"] = self._hole_ids_encoded
 
-                mesh.cell_data["x"] = intermediate_depths_desurveyed[:, 0]
-                mesh.cell_data["y"] = intermediate_depths_desurveyed[:, 1]
-                mesh.cell_data["z"] = intermediate_depths_desurveyed[:, 2]
+        mesh.cell_data["x"] = self.intermediate_depths_desurveyed[:, 0]
+        mesh.cell_data["y"] = self.intermediate_depths_desurveyed[:, 1]
+        mesh.cell_data["z"] = self.intermediate_depths_desurveyed[:, 2]
 
-                self.continuous_array_names += ["from", "to", "x", "y", "z"]
+        # dedupe so repeated make_mesh calls do not grow the name list
+        self.continuous_array_names = list(
+            dict.fromkeys(
+                self.continuous_array_names + ["from", "to", "x", "y", "z"]
+            )
+        )
 
-                for array_name in self.array_names_all:
-                    data = self.data[array_name]["values"][hole_filter]
-                    _type = self.data[array_name]["type"]
-                    if _type == "str":
-                        mesh[array_name] = data
-                    else:
-                        mesh.cell_data[array_name] = data
-                if meshes is None:
-                    meshes = mesh
-                else:
-                    meshes += mesh
+        for array_name in self.array_names_all:
+            data = self.data[array_name]["values"]
+            _type = self.data[array_name]["type"]
+            if _type == "str":
+                mesh[array_name] = data
+            else:
+                # shallow wrap: VTK references the contiguous column view
+                # instead of copying it; self keeps the buffer alive
+                vtk_arr = numpy_to_vtk(data, deep=False)
+                vtk_arr.SetName(array_name)
+                mesh.GetCellData().AddArray(vtk_arr)
 
-        self.mesh = meshes
+        self.mesh = mesh
 
-        return meshes
+        return mesh
 
     def show(self, show_collars=False, show_surveys=False, *args, **kwargs):
         """Plot the desurveyed drill hole interval data.
@@ -789,7 +1054,8 @@ class Intervals(HoleData):
 
         log = DrillLog()
 
-        from_to = self.depths[self.hole_ids == hole_id]
+        hole_indices = self._hole_indices[hole_id]
+        from_to = self.depths[hole_indices]
 
         if isinstance(log_array_names, str):
             log_array_names = [log_array_names]
@@ -798,17 +1064,15 @@ class Intervals(HoleData):
 
         for array_name in log_array_names:
             if array_name in self.categorical_array_names:
-                values = self.data[array_name]["values"][self.hole_ids == hole_id]
-                values = np.array(
-                    [self.code_to_cat_map[array_name][val] for val in values]
-                )
+                values = self.data[array_name]["values"][hole_indices]
+                values = self._code_to_cat_lut(array_name)[values]
                 cat_to_color_map = self.cat_to_color_map.get(array_name, None)
                 log.add_categorical_interval_data(
                     array_name, from_to, values, cat_to_color_map
                 )
 
             elif array_name in self.continuous_array_names:
-                values = self.data[array_name]["values"][self.hole_ids == hole_id]
+                values = self.data[array_name]["values"][hole_indices]
 
                 log.add_continuous_interval_data(array_name, from_to, values)
 
@@ -825,7 +1089,13 @@ class Collars:
 
     def __init__(self):
         self.unique_hole_ids = None
-        self.coords = None
+        self._hole_ids = None
+        self._hole_ids_encoded = None
+        self._coords = None
+        self._collar_by_id = {}
+        # bumped on every add_data so dependents (e.g. the Surveys desurvey
+        # tables, which bake collar coordinates in) can spot stale caches
+        self._version = 0
         self.mesh = None
 
     def add_data(self, hole_ids, coords):
@@ -861,7 +1131,42 @@ class Collars:
             raise ValueError("Hole IDs and coordinates must have the same length.")
 
         self.unique_hole_ids = np.unique(hole_ids)
-        self.coords = np.c_[hole_ids, coords]
+
+        # structure-of-arrays: keep the IDs separate from the coordinates so
+        # the numeric block stays contiguous float64 instead of promoting to
+        # a string/object matrix via np.c_
+        self._hole_ids = hole_ids
+        self._coords = np.ascontiguousarray(coords, dtype=np.float64)
+
+        # numeric IDs pass straight through to VTK; string IDs are encoded
+        # once so the mesh never sees a per-cell object round-trip
+        if np.issubdtype(hole_ids.dtype, np.number):
+            self._hole_ids_encoded = hole_ids
+        else:
+            self._hole_ids_encoded = pd.factorize(hole_ids)[0]
+
+        # hole ID -> collar coordinates for O(1) lookups; repeated equality
+        # scans of the full ID column are O(N) per hole
+        self._collar_by_id = dict(zip(hole_ids, self._coords))
+        self._version += 1
+
+    @property
+    def coords(self):
+        """Return the hole IDs stitched onto the collar coordinates.
+
+        Kept for compatibility; internal code uses the split `_hole_ids` and
+        `_coords` arrays, which avoid promoting the coordinates to strings.
+
+        Returns
+        -------
+        array-like
+            Hole IDs and collar coordinates as 2D array with shape (n, 4).
+
+        """
+        if self._coords is None:
+            return None
+
+        return np.c_[self._hole_ids, self._coords]
 
     def make_mesh(self):
         """Make a mesh of the drill hole collar data.
@@ -872,8 +1177,8 @@ class Collars:
             Mesh of the drill hole collar data.
 
         """
-        mesh = pv.PolyData(np.asarray(self.coords[:, 1:], dtype="float"))
-        mesh["hole ID"] = self.coords[:, 0]
+        mesh = pv.PolyData(np.ascontiguousarray(self._coords, dtype=np.float32))
+        mesh["hole ID"] = self._hole_ids_encoded
         self.mesh = mesh
         return mesh
 
@@ -890,9 +1195,15 @@ class Surveys:
 
     def __init__(self):
         self.unique_hole_ids = None
-        self.measurements = None
+        self._hole_ids = None
+        self._measurements = None
+        self._hole_order = None
         self.collars = None
         self._holes = {}
+        self._workspace = None
+        self._hole_group = None
+        self._desurvey_tables = None
+        self._collars_version = None
         self.mesh = None
 
     def add_data(self, hole_ids, dist, azm, dip):
@@ -934,15 +1245,43 @@ class Surveys:
                 "Hole IDs and survey measurements must have the same length."
             )
 
-        if np.any(np.abs(dip) > 90):
+        # single SIMD reduction; np.any would materialize a boolean mask
+        if np.max(np.abs(dip), initial=0) > 90:
             raise ValueError("Dip values must be between -90 and 90 degrees.")
 
         self.unique_hole_ids = np.unique(hole_ids)
-        self.measurements = np.c_[hole_ids, dist, azm, dip]
+
+        # structure-of-arrays: keep the IDs separate from the measurements so
+        # the numeric block stays contiguous float64 instead of promoting to
+        # a string/object matrix via np.c_; the stable hole order is computed
+        # once here and reused by locate and the desurvey table build
+        self._hole_ids = hole_ids
+        self._measurements = np.column_stack((dist, azm, dip)).astype(np.float64)
+        self._hole_order = np.argsort(hole_ids, kind="stable")
+        self._desurvey_tables = None
 
         if self.collars is not None:
             self._create_holes()
 
+    @property
+    def measurements(self):
+        """Return the hole IDs stitched onto the survey measurements.
+
+        Kept for compatibility; internal code uses the split `_hole_ids` and
+        `_measurements` arrays, which avoid promoting the measurements to
+        strings.
+
+        Returns
+        -------
+        array-like
+            Hole IDs and survey measurements as 2D array with shape (n, 4).
+
+        """
+        if self._measurements is None:
+            return None
+
+        return np.c_[self._hole_ids, self._measurements]
+
     def locate(self, collars):
         """Locate the drill hole survey data (i.e., position the top of each hole in 3D space) using the drill hole collar data.
 
@@ -953,20 +1292,86 @@ class Surveys:
 
         """
         self.collars = collars
-        for hole_id in self.unique_hole_ids:
-            hole = DrillHole()
-
-            hole.add_collar(collars.coords[collars.coords[:, 0] == hole_id, 1:][0])
 
-            measurements = np.hsplit(
-                self.measurements[self.measurements[:, 0] == hole_id, 1:], 3
+        # sort the measurements by hole once and slice contiguous per-hole
+        # groups; the per-hole boolean masks rescanned the full array H times
+        hole_ids_sorted = self._hole_ids[self._hole_order]
+        measurements_sorted = self._measurements[self._hole_order]
+        unique_ids, group_start = np.unique(hole_ids_sorted, return_index=True)
+        group_stop = np.append(group_start[1:], hole_ids_sorted.shape[0])
+
+        # all holes share one workspace and group rather than opening a new
+        # HDF5-backed workspace per hole
+        if self._workspace is None:
+            self._workspace = Workspace()
+            self._hole_group = DrillholeGroup.create(self._workspace)
+
+        for hole_id, start, stop in zip(unique_ids, group_start, group_stop):
+            hole = DrillHole(
+                workspace=self._workspace, hole_group=self._hole_group
             )
-            if (measurements[0].shape[0]) > 0:
-                hole.add_survey(measurements[0], measurements[1], measurements[2])
+            hole.name = hole_id
+
+            hole.add_collar(collars._collar_by_id[hole_id])
+
+            # the sorted block is already the contiguous (n, 3) survey array
+            hole.add_survey(measurements_sorted[start:stop])
+
+            hole._create_hole()
+
+            self._holes[hole_id] = hole
+
+        # pack the flat survey tables up front so repeated desurvey calls
+        # (e.g. Points and Intervals on the same surveys) reuse one build
+        self._desurvey_tables = self._build_desurvey_tables()
+
+    @property
+    def desurvey_tables(self):
+        """Return the flat survey buffers consumed by the batched desurvey kernel.
+
+        Built lazily and cached; invalidated when survey data change or the
+        collars the tables were built against are re-added.
+
+        Returns
+        -------
+        dict
+            Flat float64 survey buffers with per-hole start/stop offsets,
+            per-hole collar coordinates, and a hole ID to row mapping.
+
+        """
+        if (
+            self._desurvey_tables is None
+            or self._collars_version != self.collars._version
+        ):
+            self._desurvey_tables = self._build_desurvey_tables()
 
-                hole._create_hole()
+        return self._desurvey_tables
 
-                self._holes[hole_id] = hole
+    def _build_desurvey_tables(self):
+        """Pack the ragged per-hole survey measurements into flat, contiguous
+        float64 buffers with per-hole start/stop offsets.
+        """
+        self._collars_version = self.collars._version
+
+        hole_ids_sorted = self._hole_ids[self._hole_order]
+        unique_ids, survey_start = np.unique(hole_ids_sorted, return_index=True)
+        survey_stop = np.append(survey_start[1:], hole_ids_sorted.shape[0])
+
+        measurements = self._measurements[self._hole_order]
+
+        collars = np.empty((unique_ids.shape[0], 3))
+        for row, id in enumerate(unique_ids):
+            collars[row] = self.collars._collar_by_id[id]
+
+        return {
+            "hole_rows": {id: row for row, id in enumerate(unique_ids)},
+            "survey_start": survey_start.astype(np.int64),
+            "survey_stop": survey_stop.astype(np.int64),
+            "survey_depths": np.ascontiguousarray(measurements[:, 0]),
+            "survey_az": np.ascontiguousarray(measurements[:, 1]),
+            "survey_dip": np.ascontiguousarray(measurements[:, 2]),
+            "collars": collars,
+        }
 
     def make_mesh(self):
         """Make a mesh of the drill hole survey data.
@@ -977,16 +1382,50 @@ class Surveys:
             Mesh of the drill hole survey data.
 
         """
-        mesh = None
-        for hole_id in self._holes.keys():
-            hole = self._holes[hole_id]
-            depths = hole.desurvey()
-            from_to = hole._make_from_to(depths)
-            if from_to.shape[0] > 0:
-                if mesh is None:
-                    mesh = hole._make_line_mesh(from_to[:, 0], from_to[:, 1])
-                else:
-                    mesh += hole._make_line_mesh(from_to[:, 0], from_to[:, 1])
+        if len(self._holes) == 0:
+            self.mesh = None
+            return None
+
+        # desurvey every hole's survey stations with one batched kernel call;
+        # per-hole hole.desurvey() crossed the Python/geoh5 boundary H times
+        tables = self.desurvey_tables
+        depths = tables["survey_depths"]
+        stations = np.empty((depths.shape[0], 3))
+        desurvey_all(
+            tables["survey_start"],
+            tables["survey_stop"],
+            tables["survey_depths"],
+            tables["survey_az"],
+            tables["survey_dip"],
+            tables["collars"],
+            tables["survey_start"],
+            tables["survey_stop"],
+            depths,
+            stations,
+        )
+
+        # connect adjacent stations, dropping the pairs that would span from
+        # the last station of one hole to the first station of the next
+        from_idx = np.arange(depths.shape[0] - 1)
+        keep = np.ones(depths.shape[0] - 1, dtype=bool)
+        keep[tables["survey_stop"][:-1] - 1] = False
+        from_idx = from_idx[keep]
+
+        if from_idx.size == 0:
+            self.mesh = None
+            return None
+
+        # build the connectivity against the shared station array instead of
+        # interleaving duplicated segment endpoints; the stations are the
+        # point buffer and each segment indexes into it
+        n_segments = from_idx.shape[0]
+        lines = np.empty(3 * n_segments, dtype=np.int32)
+        lines[0::3] = 2
+        lines[1::3] = from_idx
+        lines[2::3] = from_idx + 1
+        mesh = pv.PolyData(
+            np.ascontiguousarray(stations, dtype=np.float32), lines=lines
+        )
 
         self.mesh = mesh
 
@@ -1011,9 +1450,16 @@ class Surveys:
 
 
 class DrillHole:
-    def __init__(self):
-        self.workspace = Workspace()
-        self.hole_group = DrillholeGroup.create(self.workspace)
+    def __init__(self, workspace=None, hole_group=None):
+        # creating a Workspace and DrillholeGroup hits the HDF5 layer; when
+        # many holes are built in a loop the caller passes shared ones in
+        if workspace is None:
+            workspace = Workspace()
+        if hole_group is None:
+            hole_group = DrillholeGroup.create(workspace)
+        self.workspace = workspace
+        self.hole_group = hole_group
+        self.name = ""
         self.array_names = []
         self.categorical_interval_array_names = []
         self.continuous_interval_array_names = []
@@ -1022,61 +1468,81 @@ class DrillHole:
 
         self.intervals = {}
         self.points = {}
+        self._desurveyed_survey = None
 
         self.cat_to_code_map = {}
         self.code_to_cat_map = {}
+        self._code_to_cat_luts = {}
         self.cat_to_color_map = {}
         self.matplotlib_formatted_color_maps = {}
 
     def add_collar(self, collar):
-        if isinstance(collar, pd.core.series.Series) | isinstance(
-            collar, pd.core.frame.DataFrame
-        ):
-            collar = collar.values[0]
+        # duck-typed: pandas objects expose .values, ndarrays pass through
+        values = getattr(collar, "values", None)
+        if values is not None:
+            collar = values[0]
 
         self.collar = collar
 
-    def add_survey(self, dist, azm, dip):
-        if isinstance(dist, pd.core.series.Series):
-            dist = dist.values
-        if isinstance(azm, pd.core.series.Series):
-            azm = azm.values
-        if isinstance(dip, pd.core.series.Series):
-            dip = dip.values
+    def add_survey(self, dist, azm=None, dip=None):
+        if azm is None and dip is None:
+            # fast path: an already-stacked (n, 3) dist/azm/dip block is
+            # taken as-is instead of being split and restacked
+            self.survey = np.asarray(dist, dtype=np.float64)
+        else:
+            # duck-typed: pandas objects expose .values, np.asarray is a
+            # no-op on existing ndarrays
+            dist = np.asarray(getattr(dist, "values", dist))
+            azm = np.asarray(getattr(azm, "values", azm))
+            dip = np.asarray(getattr(dip, "values", dip))
 
-        self.survey = np.c_[dist, azm, dip]
+            self.survey = np.c_[dist, azm, dip]
         self._create_hole()
 
     def _create_hole(self):
-        self._hole = Drillhole.create(
-            self.workspace,
-            collar=self.collar,
-            surveys=self.survey,
-            name="",
-            parent=self.hole_group,
-        )
+        # the HDF5-backed geoh5 Drillhole is only needed for .geoh5 export;
+        # creating one per hole dominates Surveys.locate for in-memory
+        # workflows, so defer it until something actually touches it
+        self._desurveyed_survey = None
+        self._hole = None
+
+    @property
+    def geoh5_hole(self):
+        """geoh5py ``Drillhole`` for this hole, created on first access."""
+        if self._hole is None:
+            self._hole = Drillhole.create(
+                self.workspace,
+                collar=self.collar,
+                surveys=self.survey,
+                name=self.name,
+                parent=self.hole_group,
+            )
+        return self._hole
 
     def _add_from_to(self, from_to):
-        if isinstance(from_to, pd.core.frame.DataFrame):
-            from_to = from_to.values
+        from_to = np.asarray(getattr(from_to, "values", from_to))
         self.from_to = from_to.astype(np.float64)
 
         return self.from_to
 
     def _make_from_to(self, depths, connected=True):
         if connected == True:
-            from_depths = depths[:-1]
-            to_depths = depths[1:]
-
-            if depths.ndim == 1:
-                depths = np.empty([from_depths.shape[0], 2])
-            else:
-                depths = np.empty([from_depths.shape[0], 2, from_depths.shape[1]])
-
-            depths[:, 0] = from_depths
-            depths[:, 1] = to_depths
+            # single allocation; stack copies both views in one memcpy each
+            return np.stack([depths[:-1], depths[1:]], axis=1)
+
+    def _code_to_cat_lut(self, name, array_name):
+        """Return a cached code-to-category lookup array for a given dataset
+        and array name, so decoding is a single fancy-index."""
+        lut = self._code_to_cat_luts.get((name, array_name))
+        if lut is None:
+            code_to_cat_map = self.code_to_cat_map[name][array_name]
+            lut = np.array(
+                [code_to_cat_map[code] for code in range(len(code_to_cat_map))],
+                dtype=object,
+            )
+            self._code_to_cat_luts[(name, array_name)] = lut
 
-            return depths
+        return lut
 
     def _add_data(self, data, name=None):
         self.cat_to_code_map[name] = data.cat_to_code_map
@@ -1088,43 +1554,91 @@ class DrillHole:
 
     def add_intervals(self, intervals, name="intervals"):
         self.intervals[name] = intervals
-        self.categorical_interval_array_names += intervals.categorical_array_names
-        self.continuous_interval_array_names += intervals.continuous_array_names
-        self.array_names += intervals.array_names_all
+        _extend_unique(
+            self.categorical_interval_array_names, intervals.categorical_array_names
+        )
+        _extend_unique(
+            self.continuous_interval_array_names, intervals.continuous_array_names
+        )
+        _extend_unique(self.array_names, intervals.array_names_all)
         self._add_data(intervals, name)
 
     def add_points(self, points, name="points"):
         self.points[name] = points
-        self.categorical_point_array_names += points.categorical_array_names
-        self.continuous_point_array_names += points.continuous_array_names
-        self.array_names += points.array_names_all
+        _extend_unique(
+            self.categorical_point_array_names, points.categorical_array_names
+        )
+        _extend_unique(
+            self.continuous_point_array_names, points.continuous_array_names
+        )
+        _extend_unique(self.array_names, points.array_names_all)
         self._add_data(points, name)
 
+    def _desurvey_numpy(self, depths):
+        """Desurvey query depths with the batched kernel over a single hole.
+
+        The kernel is numba-compiled (cached, fastmath) when numba is
+        available, so large interval and point sets run the trig and
+        integration loops at native speed; without numba the same function
+        runs interpreted over the identical buffers.
+        """
+        depths = np.ascontiguousarray(depths, dtype=np.float64)
+        survey = self.survey
+        n_stations = survey.shape[0]
+        out = np.empty((depths.shape[0], 3))
+        desurvey_all(
+            np.array([0], dtype=np.int64),
+            np.array([n_stations], dtype=np.int64),
+            np.ascontiguousarray(survey[:, 0]),
+            np.ascontiguousarray(survey[:, 1]),
+            np.ascontiguousarray(survey[:, 2]),
+            np.asarray(self.collar, dtype=np.float64).reshape(1, 3),
+            np.array([0], dtype=np.int64),
+            np.array([depths.shape[0]], dtype=np.int64),
+            depths,
+            out,
+        )
+
+        return out
+
     def desurvey(self, depths=None):
         if depths is None:
-            # return desurveyed survey depths if no depths passed
-            return self._hole.desurvey(self.survey[:, 0])
+            # return desurveyed survey depths if no depths passed; cached
+            # because every make_*_mesh call recomputes the same stations
+            if self._desurveyed_survey is None:
+                self._desurveyed_survey = self.desurvey(self.survey[:, 0])
+            return self._desurveyed_survey
         else:
-            return self._hole.desurvey(depths)
+            # always the kernel: mixing engines would make the coordinates
+            # depend on whether the geoh5 hole happened to be materialized
+            return self._desurvey_numpy(depths)
 
     def _make_line_mesh(self, from_depth, to_depth):
         """Make a mesh consisting of line segments for which a connected topology is assumed."""
-        depths = np.empty((from_depth.shape[0] + to_depth.shape[0], 3))
-        depths[0::2, :] = from_depth
-        depths[1::2, :] = to_depth
-        n_connected = np.ones(int(depths.shape[0] / 2), dtype="int") * 2
-        from_positions = np.arange(0, depths.shape[0] - 1, 2)
-        to_positions = np.arange(1, depths.shape[0], 2)
-        depth_connectivity = np.hstack(
-            np.stack([n_connected, from_positions, to_positions], axis=1)
+        # float32 endpoints: the kernel casts row-wise while interleaving, so
+        # the renderer-bound buffer never exists in float64
+        depths = np.empty((from_depth.shape[0] + to_depth.shape[0], 3), dtype=np.float32)
+        interleave_rows(
+            np.ascontiguousarray(from_depth, dtype=np.float64),
+            np.ascontiguousarray(to_depth, dtype=np.float64),
+            depths,
         )
+        # write the (2, from, to) triplets straight into the flat buffer;
+        # stacking and flattening allocates two temporaries per mesh
+        n_segments = from_depth.shape[0]
+        depth_connectivity = np.empty(3 * n_segments, dtype=np.int32)
+        depth_connectivity[0::3] = 2
+        depth_connectivity[1::3] = np.arange(0, 2 * n_segments, 2, dtype=np.int32)
+        depth_connectivity[2::3] = depth_connectivity[1::3] + 1
         mesh = pv.PolyData(depths, lines=depth_connectivity)
 
         return mesh
 
     def make_collar_mesh(self):
-        mesh = pv.PolyData(self.collar)
-        mesh["hole ID"] = self._hole.name
+        mesh = pv.PolyData(
+            np.ascontiguousarray(self.collar, dtype=np.float32).reshape(-1, 3)
+        )
+        mesh["hole ID"] = self.name
 
         return mesh
 
@@ -1141,9 +1655,13 @@ class DrillHole:
 
         intervals = self.intervals[name]
         from_to = intervals.depths
-        from_depths = self.desurvey(from_to[:, 0])
-        to_depths = self.desurvey(from_to[:, 1])
-        intermediate_depths = np.mean([from_depths, to_depths], axis=0)
+        # desurvey both endpoint sets with one geoh5 crossing
+        endpoints = self.desurvey(np.concatenate([from_to[:, 0], from_to[:, 1]]))
+        from_depths = endpoints[: from_to.shape[0]]
+        to_depths = endpoints[from_to.shape[0] :]
+        # midpoint without stacking the endpoint arrays just to reduce them
+        intermediate_depths = np.add(from_depths, to_depths)
+        intermediate_depths *= 0.5
         mesh = self._make_line_mesh(from_depths, to_depths)
 
         mesh.cell_data["from"] = from_to[:, 0]
@@ -1151,7 +1669,9 @@ class DrillHole:
         mesh.cell_data["x"] = intermediate_depths[:, 0]
         mesh.cell_data["y"] = intermediate_depths[:, 1]
         mesh.cell_data["z"] = intermediate_depths[:, 2]
-        self.continuous_interval_array_names += ["from", "to", "x", "y", "z"]
+        _extend_unique(
+            self.continuous_interval_array_names, ["from", "to", "x", "y", "z"]
+        )
         for array_name in intervals.array_names_all:
             data = intervals.data[array_name]["values"]
             _type = intervals.data[array_name]["type"]
@@ -1169,7 +1689,7 @@ class DrillHole:
         points = self.points[name]
         depths = points.depths
         depths = self.desurvey(depths)
-        mesh = pv.PolyData(depths)
+        mesh = pv.PolyData(np.ascontiguousarray(depths, dtype=np.float32))
         for array_name in points.array_names_all:
             data = points.data[array_name]["values"]
             _type = points.data[array_name]["type"]
@@ -1295,19 +1815,31 @@ class DrillHole:
                 )
                 log_array_names = interval_array_names + point_array_names
 
+            # resolve each array name to its owning dataset once; the first
+            # dataset carrying a name wins, as with the previous scan order
+            name_to_intervals = {}
+            for name, intervals in self.intervals.items():
+                for array_name in (
+                    intervals.categorical_array_names
+                    + intervals.continuous_array_names
+                ):
+                    name_to_intervals.setdefault(array_name, (name, intervals))
+
+            name_to_points = {}
+            for name, points in self.points.items():
+                for array_name in (
+                    points.categorical_array_names + points.continuous_array_names
+                ):
+                    name_to_points.setdefault(array_name, (name, points))
+
             for array_name in log_array_names:
-                for name in self.intervals.keys():
-                    intervals = self.intervals[name]
+                if array_name in name_to_intervals:
+                    name, intervals = name_to_intervals[array_name]
                     from_to = intervals.depths
                     if array_name in intervals.categorical_array_names:
                         cat_to_color_map = self.cat_to_color_map[name]
                         values = intervals.data[array_name]["values"]
-                        values = np.array(
-                            [
-                                self.code_to_cat_map[name][array_name][val]
-                                for val in values
-                            ]
-                        )
+                        values = self._code_to_cat_lut(name, array_name)[values]
                         log.add_categorical_interval_data(
                             array_name,
                             from_to,
@@ -1315,32 +1847,18 @@ class DrillHole:
                             cat_to_color_map.get(array_name, None),
                         )
 
-                        exit_flag = True
-                        break
-
-                    elif array_name in intervals.continuous_array_names:
+                    else:
                         values = intervals.data[array_name]["values"]
 
                         log.add_continuous_interval_data(array_name, from_to, values)
 
-                        exit_flag = True
-                        break
-
-                    if exit_flag == True:
-                        break
-
-                for name in self.points.keys():
-                    points = self.points[name]
+                elif array_name in name_to_points:
+                    name, points = name_to_points[array_name]
                     depths = points.depths
                     if array_name in points.categorical_array_names:
                         cat_to_color_map = self.cat_to_color_map[name]
                         values = points.data[array_name]["values"]
-                        values = np.array(
-                            [
-                                self.code_to_cat_map[name][array_name][val]
-                                for val in values
-                            ]
-                        )
+                        values = self._code_to_cat_lut(name, array_name)[values]
                         log.add_categorical_point_data(
                             array_name,
                             depths,
@@ -1348,15 +1866,6 @@ class DrillHole:
                             cat_to_color_map.get(array_name, None),
                         )
 
-                        exit_flag = True
-                        break
-
-                    elif array_name in self.continuous_point_array_names:
-                        pass
-
-                    if exit_flag == True:
-                        break
-
             log.create_figure(y_axis_label="Depth (m)")
 
             return log.fig